@@ -1,3 +1,19 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..'))
+from pipeline_cache import load_cached_pipeline, save_pipeline
+
+CONTAMINATION = 0.05
+OUTPUT = 'ae_pipeline_default_con' + str(CONTAMINATION) + '.json'
+
+# Skip rebuilding when neither this script, the primitives it uses nor the
+# written pipeline changed, which avoids loading the d3m primitive index
+data = load_cached_pipeline(OUTPUT, __file__)
+if data is not None:
+    print(data)
+    sys.exit(0)
+
 from d3m import index
 from d3m.metadata.base import ArgumentType
 from d3m.metadata.pipeline import Pipeline, PrimitiveStep
@@ -44,7 +60,6 @@ step_4.add_argument(name='inputs', argument_type=ArgumentType.CONTAINER, data_re
 # step_4.add_hyperparameter(name='hidden_neurons', argument_type=ArgumentType.VALUE, data=[1, 4, 16, 32, 16, 4, 1])
 # step_4.add_hyperparameter(name='epochs', argument_type=ArgumentType.VALUE, data=50)
 
-CONTAMINATION = 0.05
 step_4.add_hyperparameter(name='contamination', argument_type=ArgumentType.VALUE, data=CONTAMINATION)
 step_4.add_output('produce')
 pipeline_description.add_step(step_4)
@@ -61,7 +76,5 @@ pipeline_description.add_output(name='output predictions', data_reference='steps
 
 # Output to json
 data = pipeline_description.to_json()
-with open('ae_pipeline_default_con' + str(CONTAMINATION) + '.json', 'w') as f:
-    f.write(data)
-    print(data)
-
+save_pipeline(OUTPUT, __file__, data)
+print(data)
@@ -0,0 +1,77 @@
+"""Cache the pipeline JSON written by the pipeline construction scripts.
+
+The cache key covers this module, the script source and, for every primitive
+the script references, the version and module source of the installed
+package providing it, plus the d3m version that serialises the pipeline.
+Entry points are resolved without importing the primitives, so a cache hit
+never loads the d3m primitive index.
+"""
+import hashlib
+import os
+import re
+
+import pkg_resources
+
+
+def _sha1(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def _primitive_key(python_path):
+    """Describe the installed primitive registered under python_path.
+    """
+    name = python_path[len('d3m.primitives.'):]
+    for entry_point in pkg_resources.iter_entry_points('d3m.primitives', name):
+        dist = entry_point.dist
+        module_path = os.path.join(dist.location,
+                                   *entry_point.module_name.split('.')) + '.py'
+        digest = None
+        if os.path.exists(module_path):
+            with open(module_path, 'rb') as f:
+                digest = _sha1(f.read())
+        return '{} {} {} {}'.format(python_path, dist.project_name,
+                                    dist.version, digest)
+    return python_path + ' missing'
+
+
+def pipeline_key(script):
+    """Compute the cache key of the pipeline built by script.
+    """
+    with open(script, 'rb') as f:
+        source = f.read()
+
+    python_paths = sorted(set(re.findall(rb'd3m\.primitives\.[\w.]+', source)))
+    try:
+        d3m_version = pkg_resources.get_distribution('d3m').version
+    except pkg_resources.DistributionNotFound:
+        d3m_version = None
+    with open(__file__, 'rb') as f:
+        helper = f.read()
+    parts = [_sha1(helper), _sha1(source), 'd3m {}'.format(d3m_version)]
+    parts += [_primitive_key(path.decode()) for path in python_paths]
+    return _sha1('\n'.join(parts).encode())
+
+
+def load_cached_pipeline(output, script):
+    """Return the pipeline JSON previously written to output by script, or
+    None when the script, its primitives or the output changed since.
+    """
+    cache = output + '.sha1'
+    if not (os.path.exists(output) and os.path.exists(cache)):
+        return None
+
+    with open(output) as f:
+        data = f.read()
+    with open(cache) as f:
+        if f.read() != pipeline_key(script) + ' ' + _sha1(data.encode()):
+            return None
+    return data
+
+
+def save_pipeline(output, script, data):
+    """Write the pipeline JSON to output and record its cache key.
+    """
+    with open(output, 'w') as f:
+        f.write(data)
+    with open(output + '.sha1', 'w') as f:
+        f.write(pipeline_key(script) + ' ' + _sha1(data.encode()))
@@ -1,3 +1,18 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from pipeline_cache import load_cached_pipeline, save_pipeline
+
+OUTPUT = 'example_pipeline.json'
+
+# Skip rebuilding when neither this script, the primitives it uses nor the
+# written pipeline changed, which avoids loading the d3m primitive index
+data = load_cached_pipeline(OUTPUT, __file__)
+if data is not None:
+    print(data)
+    sys.exit(0)
+
 from d3m import index
 from d3m.metadata.base import ArgumentType
 from d3m.metadata.pipeline import Pipeline, PrimitiveStep
@@ -48,7 +63,5 @@ pipeline_description.add_output(name='output predictions', data_reference='steps
 
 # Output to JSON
 data = pipeline_description.to_json()
-with open('example_pipeline.json', 'w') as f:
-    f.write(data)
-    print(data)
-
+save_pipeline(OUTPUT, __file__, data)
+print(data)
@@ -82,6 +82,124 @@ class Hyperparams(Hyperparams_ODBase):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
     )
 
+    max_iter = hyperparams.Hyperparameter[int](
+        default=100,
+        description='The maximum number of boosting iterations.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+
+    learning_rate = hyperparams.Hyperparameter[float](
+        default=0.1,
+        description='The shrinkage applied to the contribution of each tree.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+
+    max_bins = hyperparams.Hyperparameter[int](
+        default=255,
+        description='The maximum number of bins each feature is discretized into. Must be no larger than 255.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+
+    min_samples_leaf = hyperparams.Hyperparameter[int](
+        default=1,
+        description='The minimum number of training windows per leaf.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+
+    max_leaf_nodes = hyperparams.Union[Union[int, None]](
+        configuration=OrderedDict(
+            init=hyperparams.Hyperparameter[int](
+                default=31,
+            ),
+            ninit=hyperparams.Hyperparameter[None](
+                default=None,
+            ),
+        ),
+        default='init',
+        description='The maximum number of leaves of each tree. If None, there is no limit.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+
+    max_depth = hyperparams.Union[Union[int, None]](
+        configuration=OrderedDict(
+            init=hyperparams.Hyperparameter[int](
+                default=3,
+            ),
+            ninit=hyperparams.Hyperparameter[None](
+                default=None,
+            ),
+        ),
+        default='ninit',
+        description='The maximum depth of each tree. If None, depth is only limited by max_leaf_nodes.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+
+    n_iter_no_change = hyperparams.Union[Union[int, None]](
+        configuration=OrderedDict(
+            init=hyperparams.Hyperparameter[int](
+                default=10,
+            ),
+            ninit=hyperparams.Hyperparameter[None](
+                default=None,
+            ),
+        ),
+        default='init',
+        description='Stop boosting when the validation loss has not improved in this many iterations. Only used with at least 10000 training windows. If None, early stopping is disabled.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+
+    validation_fraction = hyperparams.Hyperparameter[float](
+        default=0.1,
+        description='The proportion of training windows held out to check early stopping.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+
+    tol = hyperparams.Hyperparameter[float](
+        default=1e-4,
+        description='The tolerance used to decide whether the validation loss has improved.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+
+    subsample = hyperparams.Uniform(
+        lower=0.,
+        upper=1.,
+        default=1.,
+        lower_inclusive=False,
+        upper_inclusive=True,
+        description='The fraction of training windows drawn once at random to fit the regressor. All windows are still scored.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+
+    random_state = hyperparams.Union[Union[int, None]](
+        configuration=OrderedDict(
+            init=hyperparams.Hyperparameter[int](
+                default=0,
+            ),
+            ninit=hyperparams.Hyperparameter[None](
+                default=None,
+            ),
+        ),
+        default='init',
+        description='the seed used by the random number generator.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+    )
+
+    memory = hyperparams.Union(
+        configuration=OrderedDict({
+            'str': hyperparams.Hyperparameter[str](
+                default='.gbregod_cache',
+                semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+            ),
+            'none': hyperparams.Constant(
+                default=None,
+                semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+            )
+        }),
+        default='none',
+        description='Path to the directory caching fitted regressors. If None, no caching is performed.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
+    )
+
     pass
 
 
@@ -115,6 +233,51 @@ class GBRegODetectorPrimitive(UnsupervisedOutlierDetectorBase[Inputs, Outputs, P
     weights : numpy array of shape (1, n_dimensions)
         Score weight by dimensions. (default=[1,1,...,1])
 
+    max_iter : int, optional (default=100)
+        The maximum number of boosting iterations.
+
+    learning_rate : float, optional (default=0.1)
+        The shrinkage applied to the contribution of each tree.
+
+    max_bins : int, optional (default=255)
+        The maximum number of bins each feature is discretized into.
+        Must be no larger than 255.
+
+    min_samples_leaf : int, optional (default=1)
+        The minimum number of training windows per leaf.
+
+    max_leaf_nodes : int or None, optional (default=31)
+        The maximum number of leaves of each tree. If None, there is no
+        limit.
+
+    max_depth : int or None, optional (default=None)
+        The maximum depth of each tree. If None, depth is only limited by
+        ``max_leaf_nodes``.
+
+    n_iter_no_change : int or None, optional (default=10)
+        Boosting stops early when the validation loss has not improved
+        in the last ``n_iter_no_change`` iterations. If None, all
+        ``max_iter`` iterations are run. Early stopping is only used with
+        at least 10000 training windows.
+
+    validation_fraction : float, optional (default=0.1)
+        The proportion of training windows held out to check early stopping.
+
+    tol : float, optional (default=1e-4)
+        The tolerance used to decide whether the loss has improved.
+
+    subsample : float in (0., 1.], optional (default=1.0)
+        The fraction of training windows drawn once at random to fit the
+        regressor. All windows are still scored.
+
+    random_state : int or None, optional (default=0)
+        The seed of the validation split and of the window subsampling.
+
+    memory : str or None, optional (default=None)
+        Path to the directory caching fitted regressors, so refitting on
+        the same data with the same parameters skips training. If None,
+        no caching is performed.
+
     Attributes
     ----------
     decision_scores_ : numpy array of shape (n_samples,)
@@ -142,7 +305,7 @@ class GBRegODetectorPrimitive(UnsupervisedOutlierDetectorBase[Inputs, Outputs, P
         ],
         "primitive_family": metadata_base.PrimitiveFamily.ANOMALY_DETECTION,
         "version": "0.0.1",
-        "hyperparams_to_tune": ['window_size', 'contamination', 'step_size', 'method', 'weights'],
+        "hyperparams_to_tune": ['window_size', 'contamination', 'step_size', 'method', 'weights', 'max_iter', 'learning_rate', 'max_bins', 'min_samples_leaf', 'max_leaf_nodes', 'max_depth', 'n_iter_no_change', 'subsample'],
         "id": str(uuid.uuid3(uuid.NAMESPACE_DNS, 'GBRegODetector'))
     })
 
@@ -157,6 +320,18 @@ class GBRegODetectorPrimitive(UnsupervisedOutlierDetectorBase[Inputs, Outputs, P
                                     step_size=hyperparams['step_size'],
                                     method=hyperparams['method'],
                                     weights=hyperparams['weights'],
+                                    max_iter=hyperparams['max_iter'],
+                                    learning_rate=hyperparams['learning_rate'],
+                                    max_bins=hyperparams['max_bins'],
+                                    min_samples_leaf=hyperparams['min_samples_leaf'],
+                                    max_leaf_nodes=hyperparams['max_leaf_nodes'],
+                                    max_depth=hyperparams['max_depth'],
+                                    n_iter_no_change=hyperparams['n_iter_no_change'],
+                                    validation_fraction=hyperparams['validation_fraction'],
+                                    tol=hyperparams['tol'],
+                                    subsample=hyperparams['subsample'],
+                                    random_state=hyperparams['random_state'],
+                                    memory=hyperparams['memory'],
                                     )
 
         return
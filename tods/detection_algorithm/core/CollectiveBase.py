@@ -341,6 +341,8 @@ class CollectiveBaseDetector(metaclass=ABCMeta):
         self
         """
 
+        # numpy's percentile selects with np.partition (introselect), so
+        # the threshold is found in O(n) without sorting the scores
         self.threshold_ = percentile(self.decision_scores_,
                                      100 * (1 - self.contamination))
         self.labels_ = (self.decision_scores_ > self.threshold_).astype(
@@ -1,18 +1,121 @@
 # -*- coding: utf-8 -*-
 """Autoregressive model for univariate time series outlier detection.
 """
+import hashlib
+import inspect
+from itertools import product
+
 import numpy as np
-from sklearn.utils import check_array
-from sklearn.utils.validation import check_is_fitted
-from sklearn.ensemble import GradientBoostingRegressor
+from joblib import Parallel, delayed
+from sklearn.utils import check_array, check_random_state
+from sklearn.utils.validation import check_is_fitted, check_memory
+# explicitly require this experimental feature
+from sklearn.experimental import enable_hist_gradient_boosting  # noqa
+from sklearn.ensemble import HistGradientBoostingRegressor
 
 from .CollectiveBase import CollectiveBaseDetector
 
-from .utility import get_sub_matrices
+from . import utility
+from .utility import get_sub_matrices, get_sub_sequences_view, \
+    score_and_label
+
+
+def _zpad(a, n):
+    """Internal function for prepending n zeros to a 1-D array.
+    """
+    out = np.empty(n + a.size, dtype=a.dtype)
+    out[:n] = 0
+    out[n:] = a
+    return out
+
+
+# fewest training windows for which early stopping holds out validation data
+_MIN_EARLY_STOPPING_WINDOWS = 10000
+
+
+def _get_windows(X, window_size, step_size):
+    """Internal function for chopping X into moving windows and the value
+    following each of them. Univariate series are windowed as a strided
+    view to avoid copying.
+    """
+    if X.shape[1] == 1:
+        sub_matrices, X_left_inds, X_right_inds = get_sub_sequences_view(
+            X, window_size=window_size, step=step_size)
+    else:
+        sub_matrices, X_left_inds, X_right_inds = get_sub_matrices(
+            X,
+            window_size=window_size,
+            step=step_size,
+            return_numpy=True,
+            flatten=True)
+
+    # remove the last one
+    sub_matrices = sub_matrices[:-1, :]
+    X_left_inds = X_left_inds[:-1]
+    X_right_inds = X_right_inds[:-1]
+
+    valid_len = sub_matrices.shape[0]
+
+    # the target of each window is the sample right after it, kept as
+    # a 1-D view on X
+    y_vec = X[window_size:window_size + valid_len * step_size:step_size, 0]
+
+    return sub_matrices, y_vec, X_left_inds, X_right_inds
+
+
+# joblib only invalidates a cached _fit_gbr when its own source changes, so
+# the source of the windowing it depends on is passed as part of the key
+_WINDOWING_KEY = hashlib.sha1(
+    (inspect.getsource(_get_windows) +
+     inspect.getsource(utility)).encode()).hexdigest()
+
+
+def _fit_gbr(gbr, X, window_size, step_size, subsample, random_state,
+             windowing_key=_WINDOWING_KEY):
+    """Internal function for windowing X, fitting the regressor and
+    computing the absolute residuals of every training window. Cached by
+    GBRegOD.memory, so the cache key is the series and the parameters
+    rather than the much larger windows. windowing_key is only part of
+    the cache key.
+    """
+    sub_matrices, y_vec, X_left_inds, X_right_inds = _get_windows(
+        X, window_size, step_size)
+    valid_len = sub_matrices.shape[0]
+
+    # fit on a random subset of the windows, sorted to keep memory order
+    fit_inds = None
+    n_fit = valid_len
+    if subsample < 1.0:
+        n_fit = max(1, int(subsample * valid_len))
+        fit_inds = np.sort(check_random_state(random_state).choice(
+            valid_len, n_fit, replace=False))
+
+    # holding out validation windows only pays off on long series
+    if n_fit < _MIN_EARLY_STOPPING_WINDOWS:
+        gbr.set_params(n_iter_no_change=None)
+
+    if fit_inds is None:
+        gbr.fit(sub_matrices, y_vec)
+    else:
+        gbr.fit(sub_matrices[fit_inds], y_vec[fit_inds])
+
+    # predict the training windows once, predict already returns 1-D
+    # and the residuals are computed in place in its output
+    preds = gbr.predict(sub_matrices)
+    np.subtract(y_vec, preds, out=preds)
+    np.absolute(preds, out=preds)
+    return gbr, preds, X_left_inds, X_right_inds
+
+
+def _fit_one(cls, X, window_size, step_size, contamination, **kwargs):
+    """Internal function for fitting one detector, used by GBRegOD.fit_many.
+    """
+    return cls(window_size=window_size, step_size=step_size,
+               contamination=contamination, **kwargs).fit(X)
 
 
 class GBRegOD(CollectiveBaseDetector):
-    """Autoregressive models use linear regression to calculate a sample's
+    """Autoregressive models use gradient boosting regression to calculate a sample's
     deviance from the predicted value, which is then used as its
     outlier scores. This model is for univariate time series.
     See MultiAutoRegOD for multivariate data.
@@ -32,6 +135,58 @@ class GBRegOD(CollectiveBaseDetector):
         the proportion of outliers in the data set. When fitting this is used
         to define the threshold on the decision function.
 
+    max_iter : int, optional (default=100)
+        The maximum number of boosting iterations of the histogram-based
+        gradient boosting regressor.
+
+    learning_rate : float, optional (default=0.1)
+        The shrinkage applied to the contribution of each tree.
+
+    max_bins : int, optional (default=255)
+        The maximum number of bins each feature is discretized into before
+        searching for splits. Must be no larger than 255.
+
+    min_samples_leaf : int, optional (default=1)
+        The minimum number of training windows per leaf. The default lets
+        short series be split at all.
+
+    max_leaf_nodes : int or None, optional (default=31)
+        The maximum number of leaves of each tree. If None, there is no
+        limit.
+
+    max_depth : int or None, optional (default=None)
+        The maximum depth of each tree. If None, depth is only limited by
+        ``max_leaf_nodes``.
+
+    n_iter_no_change : int or None, optional (default=10)
+        Boosting stops early when the loss on the validation windows has not
+        improved by more than ``tol`` in the last ``n_iter_no_change``
+        iterations. If None, all ``max_iter`` iterations are run. Early
+        stopping is only used with at least 10000 training windows, so short
+        series are fitted on every window without a validation holdout.
+
+    validation_fraction : float, optional (default=0.1)
+        The proportion of training windows held out to check early stopping.
+
+    tol : float, optional (default=1e-4)
+        The tolerance used to decide whether the loss has improved.
+
+    subsample : float in (0., 1.], optional (default=1.0)
+        The fraction of training windows drawn once at random to fit the
+        regressor. All windows are still scored.
+
+    random_state : int, RandomState instance or None, optional (default=0)
+        The seed of the validation split and of the window subsampling.
+
+    memory : None, str or object with the joblib.Memory interface, optional (default=None)
+        Used to cache the fitted regressor and the training scores. Fitting
+        again on the same series with the same parameters then loads them
+        from the cache instead of retraining. Entries are invalidated when
+        the fitting or windowing code changes, but the cache must be
+        cleared after upgrading scikit-learn. By default, no
+        caching is performed. If a string is given, it is the path to the
+        caching directory.
+
     Attributes
     ----------
     decision_scores_ : numpy array of shape (n_samples,)
@@ -51,10 +206,26 @@ class GBRegOD(CollectiveBaseDetector):
         ``threshold_`` on ``decision_scores_``.
     """
 
-    def __init__(self, window_size, step_size=1, contamination=0.1):
+    def __init__(self, window_size, step_size=1, contamination=0.1,
+                 max_iter=100, learning_rate=0.1, max_bins=255,
+                 min_samples_leaf=1, max_leaf_nodes=31, max_depth=None,
+                 n_iter_no_change=10, validation_fraction=0.1, tol=1e-4,
+                 subsample=1.0, random_state=0, memory=None):
         super(GBRegOD, self).__init__(contamination=contamination)
         self.window_size = window_size
         self.step_size = step_size
+        self.max_iter = max_iter
+        self.learning_rate = learning_rate
+        self.max_bins = max_bins
+        self.min_samples_leaf = min_samples_leaf
+        self.max_leaf_nodes = max_leaf_nodes
+        self.max_depth = max_depth
+        self.n_iter_no_change = n_iter_no_change
+        self.validation_fraction = validation_fraction
+        self.tol = tol
+        self.subsample = subsample
+        self.random_state = random_state
+        self.memory = memory
 
     def fit(self, X: np.array) -> object:
         """Fit detector. y is ignored in unsupervised methods.
@@ -72,36 +243,78 @@ class GBRegOD(CollectiveBaseDetector):
         self : object
             Fitted estimator.
         """
-        X = check_array(X).astype(np.float)
+        if not (0. < self.subsample <= 1.):
+            raise ValueError("subsample must be in (0, 1], "
+                             "got: %f" % self.subsample)
+
+        X = check_array(X, dtype=np.float64, copy=False)
+
+        # fit the gradient boosting regression model
+        gbr = HistGradientBoostingRegressor(
+            max_iter=self.max_iter,
+            learning_rate=self.learning_rate,
+            max_bins=self.max_bins,
+            min_samples_leaf=self.min_samples_leaf,
+            max_leaf_nodes=self.max_leaf_nodes,
+            max_depth=self.max_depth,
+            scoring='loss',
+            n_iter_no_change=self.n_iter_no_change,
+            validation_fraction=self.validation_fraction,
+            tol=self.tol,
+            random_state=self.random_state)
+
+        # the windows are built inside the cached function
+        fit_gbr = check_memory(self.memory).cache(_fit_gbr)
+        self.gbr_, self.decision_scores_, self.left_inds_, self.right_inds_ = \
+            fit_gbr(gbr, X, self.window_size, self.step_size, self.subsample,
+                    self.random_state, _WINDOWING_KEY)
+        self.valid_len_ = self.decision_scores_.shape[0]
 
-        # generate X and y
-        sub_matrices, self.left_inds_, self.right_inds_ = get_sub_matrices(
-            X,
-            window_size=self.window_size,
-            step=self.step_size,
-            return_numpy=True,
-            flatten=True)
-        # remove the last one
-        sub_matrices = sub_matrices[:-1, :]
-        self.left_inds_ = self.left_inds_[:-1]
-        self.right_inds_ = self.right_inds_[:-1]
+        self._process_decision_scores()
+        return self
+
+    @classmethod
+    def fit_many(cls, X, window_sizes, step_sizes=(1,), contaminations=(0.1,),
+                 n_jobs=-1, **kwargs):
+        """Fit one detector for every combination of window size, step size
+        and contamination on the same series. The fits are independent and
+        run in parallel processes.
 
-        self.valid_len_ = sub_matrices.shape[0]
+        Parameters
+        ----------
+        X : numpy array of shape (n_samples, n_features)
+            The input samples.
 
-        y_buf = np.zeros([self.valid_len_, 1])
+        window_sizes : list of int
+            The moving window sizes to fit.
 
-        for i in range(self.valid_len_):
-            y_buf[i] = X[i * self.step_size + self.window_size]
-        # print(sub_matrices.shape, y_buf.shape)
+        step_sizes : list of int, optional (default=(1,))
+            The displacements for moving window to fit.
 
-        # fit the linear regression model
-        self.gbr_ = GradientBoostingRegressor()
-        self.gbr_.fit(sub_matrices, y_buf)
-        self.decision_scores_ = np.absolute(
-            y_buf.ravel() - self.gbr_.predict(sub_matrices).ravel())
+        contaminations : list of float, optional (default=(0.1,))
+            The contaminations to fit.
 
-        self._process_decision_scores()
-        return self
+        n_jobs : int, optional (default=-1)
+            The number of jobs to run in parallel. -1 means using all
+            processors.
+
+        **kwargs
+            Other parameters passed to every GBRegOD.
+
+        Returns
+        -------
+        detectors : list of GBRegOD
+            The fitted detectors, in the order of
+            ``itertools.product(window_sizes, step_sizes, contaminations)``.
+        """
+        X = check_array(X, dtype=np.float64, copy=False)
+
+        # joblib memory maps X, so the workers share the input array
+        return Parallel(n_jobs=n_jobs, prefer='processes')(
+            delayed(_fit_one)(cls, X, window_size, step_size, contamination,
+                              **kwargs)
+            for window_size, step_size, contamination in
+            product(window_sizes, step_sizes, contaminations))
 
     def predict(self, X): # pragma: no cover
         """Predict if a particular sample is an outlier or not.
@@ -121,14 +334,34 @@ class GBRegOD(CollectiveBaseDetector):
 
         check_is_fitted(self, ['decision_scores_', 'threshold_', 'labels_'])
 
-        pred_score, X_left_inds, X_right_inds = self.decision_function(X)
+        y_vec, pred_score, X_left_inds, X_right_inds = \
+            self._predict_windows(X)
+
+        # the leading window_size samples have no score and stay inliers,
+        # the rest are scored and labelled in place in one pass
+        pred_labels = np.zeros(self.window_size + pred_score.size,
+                               dtype='int')
+        score_and_label(y_vec, pred_score, self.threshold_, pred_score,
+                        pred_labels[self.window_size:])
+
+        X_left_inds = _zpad(X_left_inds, self.window_size)
+        X_right_inds = _zpad(X_right_inds, self.window_size)
+
+        return pred_labels, X_left_inds, X_right_inds
+
+    def _predict_windows(self, X):
+        """Internal function for predicting the value following each moving
+        window of X. Returns the observed values, the predictions and the
+        window indices.
+        """
+        check_is_fitted(self, ['gbr_'])
+        X = check_array(X, dtype=np.float64, copy=False)
 
-        pred_score = np.concatenate((np.zeros((self.window_size,)), pred_score))
-        X_left_inds = np.concatenate((np.zeros((self.window_size,)), X_left_inds))
-        X_right_inds = np.concatenate((np.zeros((self.window_size,)), X_right_inds))
+        sub_matrices, y_vec, X_left_inds, X_right_inds = _get_windows(
+            X, self.window_size, self.step_size)
 
-        return (pred_score > self.threshold_).astype(
-            'int').ravel(), X_left_inds.ravel(), X_right_inds.ravel()
+        return y_vec, self.gbr_.predict(sub_matrices), X_left_inds, \
+            X_right_inds
 
     def decision_function(self, X: np.array):
         """Predict raw anomaly scores of X using the fitted detector.
@@ -148,31 +381,13 @@ class GBRegOD(CollectiveBaseDetector):
         anomaly_scores : numpy array of shape (n_samples,)
             The anomaly score of the input samples.
         """
-        check_is_fitted(self, ['gbr_'])
-
-        sub_matrices, X_left_inds, X_right_inds = \
-            get_sub_matrices(X,
-                             window_size=self.window_size,
-                             step=self.step_size,
-                             return_numpy=True,
-                             flatten=True)
-
-        # remove the last one
-        sub_matrices = sub_matrices[:-1, :]
-        X_left_inds = X_left_inds[:-1]
-        X_right_inds = X_right_inds[:-1]
-
-        valid_len = sub_matrices.shape[0]
-
-        y_buf = np.zeros([valid_len, 1])
-
-        for i in range(valid_len):
-            y_buf[i] = X[i * self.step_size + self.window_size]
+        y_vec, pred_score, X_left_inds, X_right_inds = \
+            self._predict_windows(X)
 
-        pred_score = np.absolute(
-            y_buf.ravel() - self.gbr_.predict(sub_matrices).ravel())
+        np.subtract(y_vec, pred_score, out=pred_score)
+        np.absolute(pred_score, out=pred_score)
 
-        return pred_score, X_left_inds.ravel(), X_right_inds.ravel()
+        return pred_score, X_left_inds, X_right_inds
 
 
 if __name__ == "__main__": # pragma: no cover
@@ -43,6 +43,53 @@ class MultiGBRegOD(CollectiveBaseDetector):
     weights : numpy array of shape (1, n_dimensions)
         Score weight by dimensions.
 
+    max_iter : int, optional (default=100)
+        The maximum number of boosting iterations of each GBRegOD.
+
+    learning_rate : float, optional (default=0.1)
+        The shrinkage applied to the contribution of each tree.
+
+    max_bins : int, optional (default=255)
+        The maximum number of bins each feature is discretized into before
+        searching for splits. Must be no larger than 255.
+
+    min_samples_leaf : int, optional (default=1)
+        The minimum number of training windows per leaf. The default lets
+        short series be split at all.
+
+    max_leaf_nodes : int or None, optional (default=31)
+        The maximum number of leaves of each tree. If None, there is no
+        limit.
+
+    max_depth : int or None, optional (default=None)
+        The maximum depth of each tree. If None, depth is only limited by
+        ``max_leaf_nodes``.
+
+    n_iter_no_change : int or None, optional (default=10)
+        Boosting stops early when the validation loss has not improved by
+        more than ``tol`` in the last ``n_iter_no_change`` iterations.
+        If None, all ``max_iter`` iterations are run. Early stopping is
+        only used with at least 10000 training windows.
+
+    validation_fraction : float, optional (default=0.1)
+        The proportion of training windows held out to check early stopping.
+
+    tol : float, optional (default=1e-4)
+        The tolerance used to decide whether the loss has improved.
+
+    subsample : float in (0., 1.], optional (default=1.0)
+        The fraction of training windows drawn once at random to fit the
+        regressor. All windows are still scored.
+
+    random_state : int, RandomState instance or None, optional (default=0)
+        The seed of the validation split and of the window subsampling.
+
+    memory : None, str or object with the joblib.Memory interface, optional (default=None)
+        Used to cache the fitted regressor of each dimension. The cache
+        must be cleared after upgrading scikit-learn. By default, no
+        caching is performed. If a string is given, it is the path to the
+        caching directory.
+
     Attributes
     ----------
     decision_scores_ : numpy array of shape (n_samples,)
@@ -58,12 +105,28 @@ class MultiGBRegOD(CollectiveBaseDetector):
     """
 
     def __init__(self, window_size, step_size=1, method='average',
-                 weights=None, contamination=0.1):
+                 weights=None, contamination=0.1, max_iter=100,
+                 learning_rate=0.1, max_bins=255, min_samples_leaf=1,
+                 max_leaf_nodes=31, max_depth=None, n_iter_no_change=10,
+                 validation_fraction=0.1, tol=1e-4, subsample=1.0,
+                 random_state=0, memory=None):
         super(MultiGBRegOD, self).__init__(contamination=contamination)
         self.window_size = window_size
         self.step_size = step_size
         self.method = method
         self.weights = weights
+        self.max_iter = max_iter
+        self.learning_rate = learning_rate
+        self.max_bins = max_bins
+        self.min_samples_leaf = min_samples_leaf
+        self.max_leaf_nodes = max_leaf_nodes
+        self.max_depth = max_depth
+        self.n_iter_no_change = n_iter_no_change
+        self.validation_fraction = validation_fraction
+        self.tol = tol
+        self.subsample = subsample
+        self.random_state = random_state
+        self.memory = memory
 
     def _validate_weights(self):
         """Internal function for validating and adjust weights.
@@ -95,7 +158,19 @@ class MultiGBRegOD(CollectiveBaseDetector):
         for i in range(n_sequences):
             models.append(GBRegOD(window_size=self.window_size,
                                     step_size=self.step_size,
-                                    contamination=self.contamination))
+                                    contamination=self.contamination,
+                                    max_iter=self.max_iter,
+                                    learning_rate=self.learning_rate,
+                                    max_bins=self.max_bins,
+                                    min_samples_leaf=self.min_samples_leaf,
+                                    max_leaf_nodes=self.max_leaf_nodes,
+                                    max_depth=self.max_depth,
+                                    n_iter_no_change=self.n_iter_no_change,
+                                    validation_fraction=self.validation_fraction,
+                                    tol=self.tol,
+                                    subsample=self.subsample,
+                                    random_state=self.random_state,
+                                    memory=self.memory))
             models[i].fit(X[:, i].reshape(-1, 1))
 
         return models
@@ -128,7 +203,7 @@ class MultiGBRegOD(CollectiveBaseDetector):
         self : object
             Fitted estimator.
         """
-        X = check_array(X).astype(np.float)
+        X = check_array(X, dtype=np.float64, copy=False)
 
         # fit each dimension individually
         self.models_ = self._fit_univariate_model(X)
@@ -182,7 +257,7 @@ class MultiGBRegOD(CollectiveBaseDetector):
             The anomaly score of the input samples.
         """
         check_is_fitted(self, ['models_'])
-        X = check_array(X).astype(np.float)
+        X = check_array(X, dtype=np.float64, copy=False)
         assert (X.shape[1] == self.n_models_)
         n_samples = len(X)
 
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+import shutil
+import tempfile
+import unittest
+from itertools import product
+from unittest import mock
+
+import numpy as np
+# explicitly require this experimental feature
+from sklearn.experimental import enable_hist_gradient_boosting  # noqa
+from sklearn.ensemble import HistGradientBoostingRegressor
+
+from tods.detection_algorithm.core import GBRegOD as GBRegOD_module
+from tods.detection_algorithm.core.GBRegOD import GBRegOD
+
+
+class GBRegODTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(42)
+        self.X_train = (np.sin(np.arange(200) / 5.) +
+                        0.1 * rng.randn(200)).reshape(-1, 1)
+
+    def test_fit_many(self):
+        window_sizes, step_sizes, contaminations = [2, 5], [1, 3], [0.1, 0.2]
+        clfs = GBRegOD.fit_many(self.X_train, window_sizes, step_sizes,
+                                contaminations, n_jobs=2, max_iter=20,
+                                random_state=0)
+
+        combos = list(product(window_sizes, step_sizes, contaminations))
+        self.assertEqual(len(clfs), len(combos))
+        for clf, (window_size, step_size, contamination) in zip(clfs, combos):
+            self.assertEqual(clf.window_size, window_size)
+            self.assertEqual(clf.step_size, step_size)
+            self.assertEqual(clf.contamination, contamination)
+            self.assertEqual(clf.max_iter, 20)
+
+            ref = GBRegOD(window_size=window_size, step_size=step_size,
+                          contamination=contamination, max_iter=20,
+                          random_state=0).fit(self.X_train)
+            np.testing.assert_allclose(clf.decision_scores_,
+                                       ref.decision_scores_)
+            np.testing.assert_array_equal(clf.left_inds_, ref.left_inds_)
+            self.assertEqual(clf.threshold_, ref.threshold_)
+
+    def test_default_is_reproducible(self):
+        clf = GBRegOD(window_size=5, max_iter=20).fit(self.X_train)
+        clf_again = GBRegOD(window_size=5, max_iter=20).fit(self.X_train)
+
+        np.testing.assert_array_equal(clf.decision_scores_,
+                                      clf_again.decision_scores_)
+        self.assertEqual(clf.threshold_, clf_again.threshold_)
+
+        # short series are fitted on every window without early stopping
+        self.assertIsNone(clf.gbr_.n_iter_no_change)
+        self.assertEqual(clf.gbr_.n_iter_, 20)
+
+    def test_short_series_is_learnable(self):
+        X = np.asarray([3., 4., 8., 16, 18, 13., 22., 36., 59., 128, 62, 67,
+                        78, 100]).reshape(-1, 1)
+        clf = GBRegOD(window_size=2, max_iter=20).fit(X)
+
+        # with fewer than 2 * min_samples_leaf windows no tree could split
+        # and every window would be predicted as the mean
+        sub_matrices = np.asarray([X[i:i + 2, 0]
+                                   for i in range(clf.valid_len_)])
+        self.assertGreater(np.unique(clf.gbr_.predict(sub_matrices)).size, 1)
+
+    def test_subsample_scores_every_window(self):
+        clf = GBRegOD(window_size=5, step_size=2, max_iter=20,
+                      subsample=0.5).fit(self.X_train)
+        full = GBRegOD(window_size=5, step_size=2,
+                       max_iter=20).fit(self.X_train)
+
+        # only half of the windows are fitted, but all of them are scored
+        self.assertEqual(len(clf.decision_scores_), clf.valid_len_)
+        self.assertEqual(len(clf.left_inds_), clf.valid_len_)
+        np.testing.assert_array_equal(clf.left_inds_, full.left_inds_)
+        np.testing.assert_array_equal(clf.right_inds_, full.right_inds_)
+        self.assertTrue(np.all(np.isfinite(clf.decision_scores_)))
+        scores, _, _ = clf.decision_function(self.X_train)
+        np.testing.assert_allclose(clf.decision_scores_, scores)
+
+    def test_invalid_subsample(self):
+        for subsample in (0., -0.5, 1.5):
+            with self.assertRaises(ValueError):
+                GBRegOD(window_size=5, subsample=subsample).fit(self.X_train)
+
+    def test_memory(self):
+        cachedir = tempfile.mkdtemp()
+        try:
+            clf = GBRegOD(window_size=5, max_iter=20, random_state=0,
+                          memory=cachedir).fit(self.X_train)
+
+            # a second identical fit must be loaded without training
+            with mock.patch.object(HistGradientBoostingRegressor, 'fit',
+                                   side_effect=AssertionError('refitted')):
+                cached = GBRegOD(window_size=5, max_iter=20, random_state=0,
+                                 memory=cachedir).fit(self.X_train)
+        finally:
+            shutil.rmtree(cachedir, ignore_errors=True)
+
+        np.testing.assert_allclose(cached.decision_scores_,
+                                   clf.decision_scores_)
+        np.testing.assert_array_equal(cached.left_inds_, clf.left_inds_)
+        np.testing.assert_array_equal(cached.right_inds_, clf.right_inds_)
+        self.assertEqual(cached.valid_len_, clf.valid_len_)
+
+    def test_memory_follows_windowing(self):
+        cachedir = tempfile.mkdtemp()
+        try:
+            GBRegOD(window_size=5, max_iter=20,
+                    memory=cachedir).fit(self.X_train)
+
+            # a change of the windowing code must not reuse the entry
+            with mock.patch.object(GBRegOD_module, '_WINDOWING_KEY', 'v2'), \
+                    mock.patch.object(HistGradientBoostingRegressor, 'fit',
+                                      side_effect=AssertionError('refitted')):
+                with self.assertRaisesRegex(AssertionError, 'refitted'):
+                    GBRegOD(window_size=5, max_iter=20,
+                            memory=cachedir).fit(self.X_train)
+        finally:
+            shutil.rmtree(cachedir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from tods.detection_algorithm.core import utility
+from tods.detection_algorithm.core.utility import get_sub_matrices
+from tods.detection_algorithm.core.utility import score_and_label
+
+
+def _loop_sub_matrices(X, window_size, step, flatten, flatten_order):
+    """Reference windowing with the original per-window Python loops.
+    """
+    n_samples, n_sequences = X.shape
+    valid_len = utility.get_sub_sequences_length(n_samples, window_size, step)
+    steps = list(range(0, n_samples, step))[:valid_len]
+
+    X_sub = np.asarray([X[i: i + window_size, :] for i in steps])
+    if not flatten:
+        return X_sub, np.asarray(steps), np.asarray(steps) + window_size
+
+    order = 'C' if flatten_order == 'C' else 'F'
+    temp_array = np.zeros([valid_len, window_size * n_sequences])
+    for i in range(valid_len):
+        temp_array[i, :] = X_sub[i, :, :].flatten(order=order)
+    return temp_array, np.asarray(steps), np.asarray(steps) + window_size
+
+
+class GetSubMatricesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.X = np.asarray(
+            [[3., 5], [5., 9], [7., 2], [42., 20], [8., 12], [10., 12],
+             [12., 12], [18., 16], [20., 7], [18., 10], [23., 12], [22., 15]])
+        self.cases = [(window_size, step, flatten_order)
+                      for window_size in (1, 3)
+                      for step in (1, 2, 5)
+                      for flatten_order in ('C', 'F')]
+
+    def _check_matches_loop(self):
+        for window_size, step, flatten_order in self.cases:
+            for flatten in (True, False):
+                X_sub, left, right = get_sub_matrices(
+                    self.X, window_size, step=step, flatten=flatten,
+                    flatten_order=flatten_order)
+                X_ref, left_ref, right_ref = _loop_sub_matrices(
+                    self.X, window_size, step, flatten, flatten_order)
+
+                np.testing.assert_array_equal(X_sub, X_ref)
+                np.testing.assert_array_equal(left, left_ref)
+                np.testing.assert_array_equal(right, right_ref)
+
+    @unittest.skipIf(utility._fill_sub_matrices is None, 'numba not installed')
+    def test_numba_path(self):
+        self._check_matches_loop()
+
+    def test_numpy_path(self):
+        with mock.patch.object(utility, '_fill_sub_matrices', None):
+            self._check_matches_loop()
+
+
+class ScoreAndLabelTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(42)
+        self.y = rng.randn(50)
+        self.y_pred = rng.randn(50)
+        self.threshold = 0.8
+
+    def _check_matches_numpy(self):
+        scores_ref = np.abs(self.y - self.y_pred)
+        labels_ref = (scores_ref > self.threshold).astype('int')
+
+        scores = np.empty_like(self.y)
+        labels = np.zeros(self.y.shape[0], dtype='int')
+        score_and_label(self.y, self.y_pred, self.threshold, scores, labels)
+        np.testing.assert_allclose(scores, scores_ref)
+        np.testing.assert_array_equal(labels, labels_ref)
+
+        # the residuals may overwrite the predictions
+        y_pred = self.y_pred.copy()
+        labels = np.zeros(self.y.shape[0], dtype='int')
+        score_and_label(self.y, y_pred, self.threshold, y_pred, labels)
+        np.testing.assert_allclose(y_pred, scores_ref)
+        np.testing.assert_array_equal(labels, labels_ref)
+
+    @unittest.skipIf(utility._fill_scores_labels is None,
+                     'numba not installed')
+    def test_numba_path(self):
+        self._check_matches_numpy()
+
+    def test_numpy_path(self):
+        with mock.patch.object(utility, '_fill_scores_labels', None):
+            self._check_matches_numpy()
+
+
+if __name__ == '__main__':
+    unittest.main()
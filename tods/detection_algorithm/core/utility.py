@@ -3,8 +3,42 @@
 """
 
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 from sklearn.utils import check_array
 
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _fill_sub_matrices(X, window_size, step, order_c, out):
+        """Fill out with the flattened moving windows of X in parallel.
+        """
+        n_sequences = X.shape[1]
+        for i in prange(out.shape[0]):
+            for j in range(window_size):
+                for k in range(n_sequences):
+                    if order_c:
+                        out[i, j * n_sequences + k] = X[i * step + j, k]
+                    else:
+                        out[i, k * window_size + j] = X[i * step + j, k]
+
+    @njit(parallel=True, cache=True)
+    def _fill_scores_labels(y, y_pred, threshold, out_scores, out_labels):
+        """Fill the absolute residuals and their binary labels in one pass.
+        """
+        for i in prange(out_scores.shape[0]):
+            d = y[i] - y_pred[i]
+            s = d if d >= 0 else -d
+            out_scores[i] = s
+            out_labels[i] = s > threshold
+else:  # pragma: no cover
+    _fill_sub_matrices = None
+    _fill_scores_labels = None
+
 
 # def get_sub_sequences(X, window_size, step=1):
 #     """Chop a univariate time series into sub sequences.
@@ -77,12 +111,31 @@ def get_sub_matrices(X, window_size, step=1, return_numpy=True, flatten=True,
     X_sub : numpy array of shape (valid_len, window_size*n_sequences)
         The numpy matrix with each row stands for a flattend submatrix.
     """
-    X = check_array(X).astype(np.float)
+    X = check_array(X, dtype=np.float64, copy=False)
     n_samples, n_sequences = X.shape[0], X.shape[1]
 
     # get the valid length
     valid_len = get_sub_sequences_length(n_samples, window_size, step)
 
+    if return_numpy:
+        # exclude the edge
+        X_left_inds = np.arange(valid_len) * step
+        X_right_inds = X_left_inds + window_size
+
+        if flatten and _fill_sub_matrices is not None:
+            temp_array = np.empty([valid_len, window_size * n_sequences])
+            _fill_sub_matrices(X, window_size, step, flatten_order == 'C',
+                               temp_array)
+            return temp_array, X_left_inds, X_right_inds
+
+        # (valid_len, window_size, n_sequences) by fancy indexing
+        X_sub = X[X_left_inds[:, None] + np.arange(window_size)]
+        if flatten:
+            if flatten_order != 'C':
+                X_sub = X_sub.transpose(0, 2, 1)
+            X_sub = X_sub.reshape(valid_len, window_size * n_sequences)
+        return X_sub, X_left_inds, X_right_inds
+
     X_sub = []
     X_left_inds = []
     X_right_inds = []
@@ -97,26 +150,77 @@ def get_sub_matrices(X, window_size, step=1, return_numpy=True, flatten=True,
         X_left_inds.append(i)
         X_right_inds.append(i + window_size)
 
-    X_sub = np.asarray(X_sub)
+    return X_sub, np.asarray(X_left_inds), np.asarray(X_right_inds)
 
-    if return_numpy:
-        if flatten:
-            temp_array = np.zeros([valid_len, window_size * n_sequences])
-            if flatten_order == 'C':
-                for i in range(valid_len):
-                    temp_array[i, :] = X_sub[i, :, :].flatten(order='C')
-
-            else:
-                for i in range(valid_len):
-                    temp_array[i, :] = X_sub[i, :, :].flatten(order='F')
-            return temp_array, np.asarray(X_left_inds), np.asarray(
-                X_right_inds)
-
-        else:
-            return np.asarray(X_sub), np.asarray(X_left_inds), np.asarray(
-                X_right_inds)
-    else:
-        return X_sub, np.asarray(X_left_inds), np.asarray(X_right_inds)
+
+def get_sub_sequences_view(X, window_size, step=1):
+    """Chop a univariate time series into sub sequences without copying.
+    The returned matrix is a read-only strided view on ``X``, row for row
+    identical to the flattened output of :func:`get_sub_matrices`.
+
+    Parameters
+    ----------
+    X : numpy array of shape (n_samples,) or (n_samples, 1)
+        The input samples.
+
+    window_size : int
+        The moving window size.
+
+    step_size : int, optional (default=1)
+        The displacement for moving window.
+
+    Returns
+    -------
+    X_sub : numpy array of shape (valid_len, window_size)
+        The read-only view with each row stands for a subsequence.
+    """
+    X = np.asarray(X)
+    if X.ndim == 2:
+        X = X[:, 0]
+    n_samples = X.shape[0]
+
+    # get the valid length
+    valid_len = get_sub_sequences_length(n_samples, window_size, step)
+
+    X_left_inds = np.arange(valid_len) * step
+    X_right_inds = X_left_inds + window_size
+
+    X_sub = as_strided(X, shape=(valid_len, window_size),
+                       strides=(X.strides[0] * step, X.strides[0]),
+                       writeable=False)
+    return X_sub, X_left_inds, X_right_inds
+
+
+def score_and_label(y, y_pred, threshold, out_scores, out_labels):
+    """Compute the absolute residuals of a regression and label the ones
+    above threshold as outliers. With numba installed both are written in a
+    single fused pass. out_scores may alias y_pred.
+
+    Parameters
+    ----------
+    y : numpy array of shape (n_samples,)
+        The observed values.
+
+    y_pred : numpy array of shape (n_samples,)
+        The predicted values.
+
+    threshold : float
+        The threshold on the residuals.
+
+    out_scores : numpy array of shape (n_samples,)
+        The float array receiving the absolute residuals.
+
+    out_labels : numpy array of shape (n_samples,)
+        The integer array receiving the labels, 0 stands for inliers
+        and 1 for outliers.
+    """
+    if _fill_scores_labels is not None:
+        _fill_scores_labels(y, y_pred, threshold, out_scores, out_labels)
+        return
+
+    np.subtract(y, y_pred, out=out_scores)
+    np.absolute(out_scores, out=out_scores)
+    np.greater(out_scores, threshold, out=out_labels)
 
 
 def get_sub_sequences_length(n_samples, window_size, step):